@@ -1,3 +1,4 @@
+import hashlib
 import streamlit as st
 from conversation import TripConversationAgent
 from travel_itenary_workflow import ItenaryGeneratorWorkflow
@@ -17,6 +18,11 @@ st.set_page_config(
 st.title("AI Travel Planner")
 if "are_keys_avaibale" not in st.session_state:
     st.session_state["are_keys_avaibale"] = False 
+# Initialized before the sidebar so "Clear Conversation" can always reset them
+if "history_pages" not in st.session_state:
+    st.session_state.history_pages = 0
+if "summary_cache" not in st.session_state:
+    st.session_state.summary_cache = {}
         
 
 
@@ -71,6 +77,8 @@ with st.sidebar:
     st.divider()
     if st.button("Clear Conversation"):
         st.session_state.messages.clear() 
+        st.session_state.history_pages = 0
+        st.session_state.summary_cache.clear()
         if "conversation_agent" in st.session_state:
             st.session_state["conversation_agent"].reset()
             
@@ -85,8 +93,60 @@ if "messages" not in st.session_state:
 if "conversation_state" not in st.session_state:
     st.session_state.conversation_state = {}
 
+# Only the most recent messages are rendered in full; older ones are paged in
+# as collapsed summaries so rerun cost does not grow with session length.
+RECENT_MESSAGES = 6
+HISTORY_PAGE_SIZE = 10
+SUMMARY_LENGTH = 80
+
+
+def summarize_message(message: dict) -> tuple:
+    """
+    Return the cache key and a one-line summary for a chat message.
+
+    Args:
+        message (dict): Chat message with "role" and "content" keys.
+
+    Returns:
+        tuple: Content hash and summary text.
+    """
+    content = message["content"] or ""
+    key = hashlib.sha1(content.encode("utf-8")).hexdigest()
+    # Only the one-line summaries are cached; expanded markdown is rendered fresh by Streamlit.
+    # The cache lives for the session and is emptied by "Clear Conversation".
+    cache = st.session_state.summary_cache
+    if key not in cache:
+        lines = [line.strip() for line in content.splitlines() if line.strip()]
+        headings = [line.lstrip("#").strip() for line in lines if line.startswith("#")]
+        summary = headings[0] if message.get("kind") == "itinerary" and headings else (lines[0] if lines else "")
+        summary = summary.replace("*", "")
+        if len(summary) > SUMMARY_LENGTH:
+            summary = summary[:SUMMARY_LENGTH].rstrip() + "…"
+        if message.get("kind") == "itinerary":
+            summary = f"🗺️ Itinerary: {summary}"
+        cache[key] = summary
+    return key, cache[key]
+
+
 # Display chat history
-for message in st.session_state.messages:
+messages = st.session_state.messages
+recent_start = max(len(messages) - RECENT_MESSAGES, 0)
+older_start = max(recent_start - st.session_state.history_pages * HISTORY_PAGE_SIZE, 0)
+
+if older_start > 0:
+    if st.button(f"Show earlier messages ({older_start} hidden)"):
+        st.session_state.history_pages += 1
+        st.rerun()
+
+for index in range(older_start, recent_start):
+    message = messages[index]
+    key, summary = summarize_message(message)
+    with st.chat_message(message["role"]):
+        # Full markdown is only rendered for messages the user expands
+        if st.toggle(summary, key=f"expand_{index}_{key}"):
+            st.markdown(message["content"])
+
+for message in messages[recent_start:]:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
 
@@ -112,11 +172,17 @@ if user_query:
             with st.chat_message("assistant"):
                 st.markdown(response["message"])
         else:
+            st.session_state.messages.append({"role": "assistant", "content": response["message"]})
             with st.chat_message("assistant"):
                 st.markdown(response["message"])
         
             with st.spinner("Planning your trip... 🌍\n\n1️⃣ Fetching flight options\n2️⃣ Searching hotels\n3️⃣ Compiling activities"):
                 itenary_markdown = st.session_state["itenaryGeneratorWorkflow"].run(response['data'])
+            itinerary_message = {"role": "assistant", "content": itenary_markdown.content or ""}
+            # Failed runs return an error RunResponse; keep those out of the itinerary summaries
+            if getattr(itenary_markdown, "status", None) != "error":
+                itinerary_message["kind"] = "itinerary"
+            st.session_state.messages.append(itinerary_message)
             with st.chat_message("assistant"):
                 st.markdown(itenary_markdown.content)
                 st.download_button(
@@ -1,6 +1,7 @@
 from agno.agent import Agent, RunResponse
 import json
 from instructions import Instructions
+from locations import LOCATION_INDEX
 from utils import getModel
 
 MESSAGE_SUFFIX = "\n-If any of these parameters are missing, please create a conversational response for the user to provide them and include it in the 'message' key of the output JSON."
@@ -36,8 +37,22 @@ class TripConversationAgent(Agent):
             "requirements": None
         }
         self.final_param_keys = list(self.final_params.keys())
+        self.location_keys = ("origin", "destination")
         self.suffix = ""
 
+    def __canonicalize_location(self, value):
+        """
+        Map a free-text origin/destination to its canonical city name.
+
+        Args:
+            value: Place as returned by the LLM (e.g. "NYC", "JFK", "New York City").
+
+        Returns:
+            The canonical city name, or the original value if it is not in the index.
+        """
+        location = LOCATION_INDEX.resolve(value)
+        return location.city if location else value
+
     def __process_tripdata(self, params_llm: dict) -> dict:
         """
         Process LLM-extracted parameters and identify missing ones.
@@ -46,27 +61,46 @@ class TripConversationAgent(Agent):
             params_llm (dict): Parameters extracted by the LLM.
 
         Returns:
-            dict: Contains user message, query suffix, and missing status.
+            dict: Contains user message, query suffix, missing status, and whether the
+            message was set locally and must not be replaced by the LLM's.
         """
         missing = []
+        user_message = None
         for key in self.final_param_keys:
             if not self.final_params[key]:  # Only update if not already set
                 if key in params_llm and params_llm[key]:
-                    self.final_params[key] = params_llm[key]
+                    value = params_llm[key]
+                    if key in self.location_keys:
+                        value = self.__canonicalize_location(value)
+                    self.final_params[key] = value
                 else:
                     missing.append(key)
 
+        # Origin and destination resolving to the same city is never a valid trip
+        origin, destination = self.final_params["origin"], self.final_params["destination"]
+        if origin and destination and origin == destination:
+            self.final_params["destination"] = None
+            if "destination" not in missing:
+                missing.append("destination")
+            user_message = f"Origin and destination are both {origin} — where are you travelling to?"
+            # This message replaces the LLM's, so it must still list everything else outstanding
+            others = [key for key in missing if key != "destination"]
+            if others:
+                user_message += f" Also missing: {', '.join(others)}."
+
         if missing:
             missing_params = ", ".join(missing)
             return {
-                "user_message": f"Please provide the following missing details: {missing_params}.",
+                "user_message": user_message or f"Please provide the following missing details: {missing_params}.",
                 "query_suffix": f"\n-Identify only the following parameters: {missing_params} and return them in the output JSON.{MESSAGE_SUFFIX}",
-                "missing": True
+                "missing": True,
+                "local_message": user_message is not None
             }
         return {
             "user_message": "Thank you! Planning your trip...",
             "query_suffix": "",
-            "missing": False
+            "missing": False,
+            "local_message": False
         }
 
     def reset(self):
@@ -122,8 +156,9 @@ class TripConversationAgent(Agent):
             user_message = result["user_message"]
             have_further_conversation = result["missing"]
 
-            # Use LLM-provided message if available and conversation continues
-            if "message" in params and params["message"] and have_further_conversation:
+            # Use LLM-provided message if available and conversation continues,
+            # unless a local validation has already explained what is wrong
+            if "message" in params and params["message"] and have_further_conversation and not result["local_message"]:
                 user_message = params["message"]
 
             return {
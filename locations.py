@@ -0,0 +1,285 @@
+from bisect import bisect_left
+from difflib import get_close_matches
+from typing import NamedTuple, Optional
+import re
+import unicodedata
+
+
+class Location(NamedTuple):
+    """
+    A canonical city entry in the location index.
+    """
+    code: str
+    city: str
+    country: str
+    region: tuple
+    airports: tuple
+
+
+# (city/metro IATA code, city, country, state/province (postal code, name), airport IATA codes, aliases)
+# Aliases include common airport names so "Heathrow" or "Newark" resolve like "LHR" or "EWR".
+# Coverage is a seed list of major airport-served cities; anything else is left as the LLM returned it.
+_LOCATIONS = (
+    # North America
+    ("NYC", "New York", "United States", ("NY", "New York"), ("JFK", "LGA", "EWR"), ("new york city", "nyc", "ny", "manhattan", "big apple", "jfk", "john f kennedy", "laguardia", "newark")),
+    ("LAX", "Los Angeles", "United States", ("CA", "California"), ("LAX", "BUR", "SNA"), ("la", "l.a.", "lax", "burbank")),
+    ("SFO", "San Francisco", "United States", ("CA", "California"), ("SFO", "OAK", "SJC"), ("sf", "san fran", "oakland")),
+    ("SAN", "San Diego", "United States", ("CA", "California"), ("SAN",), ()),
+    ("SEA", "Seattle", "United States", ("WA", "Washington"), ("SEA",), ("seattle tacoma", "sea tac")),
+    ("PDX", "Portland", "United States", ("OR", "Oregon"), ("PDX",), ()),
+    ("LAS", "Las Vegas", "United States", ("NV", "Nevada"), ("LAS",), ("vegas", "harry reid")),
+    ("PHX", "Phoenix", "United States", ("AZ", "Arizona"), ("PHX",), ("sky harbor",)),
+    ("DEN", "Denver", "United States", ("CO", "Colorado"), ("DEN",), ()),
+    ("DFW", "Dallas", "United States", ("TX", "Texas"), ("DFW", "DAL"), ("dallas fort worth", "love field")),
+    ("HOU", "Houston", "United States", ("TX", "Texas"), ("IAH", "HOU"), ("george bush intercontinental", "hobby")),
+    ("AUS", "Austin", "United States", ("TX", "Texas"), ("AUS",), ()),
+    ("CHI", "Chicago", "United States", ("IL", "Illinois"), ("ORD", "MDW"), ("o hare", "ohare", "midway")),
+    ("MSP", "Minneapolis", "United States", ("MN", "Minnesota"), ("MSP",), ()),
+    ("DTT", "Detroit", "United States", ("MI", "Michigan"), ("DTW",), ()),
+    ("ATL", "Atlanta", "United States", ("GA", "Georgia"), ("ATL",), ("hartsfield jackson",)),
+    ("MIA", "Miami", "United States", ("FL", "Florida"), ("MIA", "FLL"), ("fort lauderdale",)),
+    ("ORL", "Orlando", "United States", ("FL", "Florida"), ("MCO",), ()),
+    ("TPA", "Tampa", "United States", ("FL", "Florida"), ("TPA",), ()),
+    ("CLT", "Charlotte", "United States", ("NC", "North Carolina"), ("CLT",), ()),
+    ("WAS", "Washington", "United States", ("DC", "District of Columbia"), ("IAD", "DCA", "BWI"), ("washington dc", "washington d.c.", "dc", "dulles", "reagan national")),
+    ("PHL", "Philadelphia", "United States", ("PA", "Pennsylvania"), ("PHL",), ("philly",)),
+    ("BOS", "Boston", "United States", ("MA", "Massachusetts"), ("BOS",), ("logan",)),
+    ("HNL", "Honolulu", "United States", ("HI", "Hawaii"), ("HNL",), ()),
+    ("YTO", "Toronto", "Canada", ("ON", "Ontario"), ("YYZ", "YTZ"), ("pearson",)),
+    ("YVR", "Vancouver", "Canada", ("BC", "British Columbia"), ("YVR",), ()),
+    ("YMQ", "Montreal", "Canada", ("QC", "Quebec"), ("YUL",), ("montréal", "trudeau")),
+    ("YYC", "Calgary", "Canada", ("AB", "Alberta"), ("YYC",), ()),
+    ("MEX", "Mexico City", "Mexico", (), ("MEX",), ("cdmx",)),
+    ("CUN", "Cancun", "Mexico", (), ("CUN",), ("cancún",)),
+    # South America
+    ("SAO", "Sao Paulo", "Brazil", (), ("GRU", "CGH"), ("são paulo", "guarulhos")),
+    ("RIO", "Rio de Janeiro", "Brazil", (), ("GIG", "SDU"), ("rio", "galeao")),
+    ("BUE", "Buenos Aires", "Argentina", (), ("EZE", "AEP"), ("ezeiza",)),
+    ("BOG", "Bogota", "Colombia", (), ("BOG",), ("bogotá",)),
+    ("LIM", "Lima", "Peru", (), ("LIM",), ()),
+    ("SCL", "Santiago", "Chile", (), ("SCL",), ()),
+    # Europe
+    ("LON", "London", "United Kingdom", (), ("LHR", "LGW", "STN", "LTN", "LCY"), ("heathrow", "gatwick", "stansted", "luton", "london city")),
+    ("MAN", "Manchester", "United Kingdom", (), ("MAN",), ()),
+    ("EDI", "Edinburgh", "United Kingdom", (), ("EDI",), ()),
+    ("DUB", "Dublin", "Ireland", (), ("DUB",), ()),
+    ("PAR", "Paris", "France", (), ("CDG", "ORY"), ("charles de gaulle", "roissy", "orly")),
+    ("NCE", "Nice", "France", (), ("NCE",), ()),
+    ("LYS", "Lyon", "France", (), ("LYS",), ("lyons",)),
+    ("AMS", "Amsterdam", "Netherlands", (), ("AMS",), ("schiphol",)),
+    ("BRU", "Brussels", "Belgium", (), ("BRU",), ("bruxelles", "zaventem")),
+    ("BER", "Berlin", "Germany", (), ("BER",), ("brandenburg",)),
+    ("FRA", "Frankfurt", "Germany", (), ("FRA",), ()),
+    ("MUC", "Munich", "Germany", (), ("MUC",), ("münchen", "muenchen")),
+    ("ZRH", "Zurich", "Switzerland", (), ("ZRH",), ("zürich",)),
+    ("GVA", "Geneva", "Switzerland", (), ("GVA",), ("genève",)),
+    ("VIE", "Vienna", "Austria", (), ("VIE",), ("wien",)),
+    ("PRG", "Prague", "Czech Republic", (), ("PRG",), ("praha",)),
+    ("BUD", "Budapest", "Hungary", (), ("BUD",), ()),
+    ("WAW", "Warsaw", "Poland", (), ("WAW",), ("chopin",)),
+    ("CPH", "Copenhagen", "Denmark", (), ("CPH",), ("kastrup",)),
+    ("STO", "Stockholm", "Sweden", (), ("ARN",), ("arlanda",)),
+    ("OSL", "Oslo", "Norway", (), ("OSL",), ("gardermoen",)),
+    ("HEL", "Helsinki", "Finland", (), ("HEL",), ()),
+    ("REK", "Reykjavik", "Iceland", (), ("KEF",), ("reykjavík", "keflavik")),
+    ("MAD", "Madrid", "Spain", (), ("MAD",), ("barajas",)),
+    ("BCN", "Barcelona", "Spain", (), ("BCN",), ("el prat",)),
+    ("SVQ", "Seville", "Spain", (), ("SVQ",), ("sevilla",)),
+    ("PMI", "Palma de Mallorca", "Spain", (), ("PMI",), ("mallorca", "majorca")),
+    ("LIS", "Lisbon", "Portugal", (), ("LIS",), ("lisboa",)),
+    ("OPO", "Porto", "Portugal", (), ("OPO",), ("oporto",)),
+    ("ROM", "Rome", "Italy", (), ("FCO", "CIA"), ("roma", "fiumicino", "ciampino")),
+    ("MIL", "Milan", "Italy", (), ("MXP", "LIN"), ("milano", "malpensa", "linate")),
+    ("VCE", "Venice", "Italy", (), ("VCE",), ("venezia",)),
+    ("FLR", "Florence", "Italy", (), ("FLR",), ("firenze",)),
+    ("NAP", "Naples", "Italy", (), ("NAP",), ("napoli",)),
+    ("ATH", "Athens", "Greece", (), ("ATH",), ()),
+    ("IST", "Istanbul", "Turkey", (), ("IST", "SAW"), ("sabiha gokcen",)),
+    ("MOW", "Moscow", "Russia", (), ("SVO", "DME", "VKO"), ("sheremetyevo", "domodedovo")),
+    # Africa and the Middle East
+    ("CAI", "Cairo", "Egypt", (), ("CAI",), ()),
+    ("RAK", "Marrakech", "Morocco", (), ("RAK",), ("marrakesh",)),
+    ("JNB", "Johannesburg", "South Africa", (), ("JNB",), ("joburg", "or tambo")),
+    ("CPT", "Cape Town", "South Africa", (), ("CPT",), ()),
+    ("NBO", "Nairobi", "Kenya", (), ("NBO",), ()),
+    ("ADD", "Addis Ababa", "Ethiopia", (), ("ADD",), ()),
+    ("LOS", "Lagos", "Nigeria", (), ("LOS",), ()),
+    ("DXB", "Dubai", "United Arab Emirates", (), ("DXB", "DWC"), ()),
+    ("AUH", "Abu Dhabi", "United Arab Emirates", (), ("AUH",), ()),
+    ("DOH", "Doha", "Qatar", (), ("DOH",), ("hamad",)),
+    ("RUH", "Riyadh", "Saudi Arabia", (), ("RUH",), ()),
+    ("JED", "Jeddah", "Saudi Arabia", (), ("JED",), ()),
+    ("TLV", "Tel Aviv", "Israel", (), ("TLV",), ("ben gurion",)),
+    ("AMM", "Amman", "Jordan", (), ("AMM",), ()),
+    # Asia and Oceania
+    ("KHI", "Karachi", "Pakistan", (), ("KHI",), ()),
+    ("LHE", "Lahore", "Pakistan", (), ("LHE",), ()),
+    ("ISB", "Islamabad", "Pakistan", (), ("ISB",), ()),
+    ("DEL", "Delhi", "India", (), ("DEL",), ("new delhi",)),
+    ("BOM", "Mumbai", "India", (), ("BOM",), ("bombay",)),
+    ("BLR", "Bangalore", "India", (), ("BLR",), ("bengaluru",)),
+    ("MAA", "Chennai", "India", (), ("MAA",), ("madras",)),
+    ("MLE", "Male", "Maldives", (), ("MLE",), ("maldives",)),
+    ("CMB", "Colombo", "Sri Lanka", (), ("CMB",), ()),
+    ("KTM", "Kathmandu", "Nepal", (), ("KTM",), ()),
+    ("BKK", "Bangkok", "Thailand", (), ("BKK", "DMK"), ("suvarnabhumi", "don mueang")),
+    ("HKT", "Phuket", "Thailand", (), ("HKT",), ()),
+    ("SGN", "Ho Chi Minh City", "Vietnam", (), ("SGN",), ("saigon",)),
+    ("HAN", "Hanoi", "Vietnam", (), ("HAN",), ()),
+    ("SIN", "Singapore", "Singapore", (), ("SIN",), ("changi",)),
+    ("KUL", "Kuala Lumpur", "Malaysia", (), ("KUL",), ("kl",)),
+    ("DPS", "Bali", "Indonesia", (), ("DPS",), ("denpasar",)),
+    ("JKT", "Jakarta", "Indonesia", (), ("CGK",), ("soekarno hatta",)),
+    ("MNL", "Manila", "Philippines", (), ("MNL",), ()),
+    ("HKG", "Hong Kong", "Hong Kong", (), ("HKG",), ()),
+    ("TPE", "Taipei", "Taiwan", (), ("TPE",), ("taoyuan",)),
+    ("BJS", "Beijing", "China", (), ("PEK", "PKX"), ("peking",)),
+    ("SHA", "Shanghai", "China", (), ("PVG", "SHA"), ("pudong", "hongqiao")),
+    ("CAN", "Guangzhou", "China", (), ("CAN",), ("canton",)),
+    ("SEL", "Seoul", "South Korea", (), ("ICN", "GMP"), ("incheon", "gimpo")),
+    ("TYO", "Tokyo", "Japan", (), ("HND", "NRT"), ("haneda", "narita")),
+    ("OSA", "Osaka", "Japan", (), ("KIX", "ITM"), ("kansai", "itami")),
+    ("UKY", "Kyoto", "Japan", (), ("KIX", "ITM"), ()),
+    ("SYD", "Sydney", "Australia", ("NSW", "New South Wales"), ("SYD",), ("kingsford smith",)),
+    ("MEL", "Melbourne", "Australia", ("VIC", "Victoria"), ("MEL",), ("tullamarine",)),
+    ("BNE", "Brisbane", "Australia", ("QLD", "Queensland"), ("BNE",), ()),
+    ("PER", "Perth", "Australia", ("WA", "Western Australia"), ("PER",), ()),
+    ("AKL", "Auckland", "New Zealand", (), ("AKL",), ()),
+)
+
+# Alternative spellings accepted as the country qualifier in "City, Country"; state or
+# province qualifiers ("New York, NY", "Toronto, Ontario") come from each row's region
+_COUNTRY_ALIASES = {
+    "United States": ("us", "usa", "u s a", "america", "united states of america"),
+    "United Kingdom": ("uk", "u k", "gb", "great britain", "britain", "england", "scotland"),
+    "Netherlands": ("holland", "the netherlands"),
+    "Czech Republic": ("czechia",),
+    "Turkey": ("turkiye",),
+    "United Arab Emirates": ("uae", "u a e"),
+    "South Korea": ("korea", "republic of korea"),
+    "Hong Kong": ("china",),
+}
+
+# Fuzzy matching is only attempted for inputs at least this long
+_MIN_FUZZY_LENGTH = 5
+
+
+def _normalize(text: str) -> str:
+    """
+    Fold a free-text place name to a lookup key (lowercase, no accents or punctuation).
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^a-z0-9 ]+", " ", text.lower())
+    return " ".join(text.split())
+
+
+class LocationIndex:
+    """
+    An offline index of cities, IATA airport codes and aliases.
+
+    City names and aliases are folded into a sorted key array with a parallel array of
+    location positions, so exact lookups are a binary search. IATA codes live in a
+    separate array and only match when given in upper case, so ordinary words such as
+    "Sea" or "Man" are not mistaken for airports. Fuzzy lookups only run when the exact
+    match misses, and only against full city names and multi-word aliases.
+    """
+
+    def __init__(self, rows: tuple = _LOCATIONS):
+        """
+        Build the index.
+
+        Args:
+            rows (tuple): Rows of (code, city, country, region, airports, aliases).
+        """
+        self.locations = tuple(
+            Location(code, city, country, region, airports) for code, city, country, region, airports, _ in rows
+        )
+        names, codes = {}, {}
+        for position, (code, city, _, _, airports, aliases) in enumerate(rows):
+            for name in (city, *aliases):
+                names.setdefault(_normalize(name), position)
+            for airport in (code, *airports):
+                codes.setdefault(airport, position)
+        self._name_keys = sorted(names)
+        self._name_positions = [names[key] for key in self._name_keys]
+        self._code_keys = sorted(codes)
+        self._code_positions = [codes[key] for key in self._code_keys]
+        self._fuzzy_keys = [
+            key for key in self._name_keys
+            if len(key) > 3 and (key == _normalize(self.locations[names[key]].city) or " " in key)
+        ]
+
+    @staticmethod
+    def _lookup(keys: list, positions: list, key: str) -> Optional[int]:
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return positions[i]
+        return None
+
+    def _exact(self, text: str) -> Optional[Location]:
+        position = None
+        code = text.strip()
+        if len(code) == 3 and code.isalpha() and code.isupper():
+            position = self._lookup(self._code_keys, self._code_positions, code)
+        if position is None:
+            position = self._lookup(self._name_keys, self._name_positions, _normalize(text))
+        return self.locations[position] if position is not None else None
+
+    def _fuzzy(self, key: str, cutoff: float) -> Optional[Location]:
+        if len(key) < _MIN_FUZZY_LENGTH:
+            return None
+        matches = get_close_matches(key, self._fuzzy_keys, n=2, cutoff=cutoff)
+        candidates = {self._exact(match) for match in matches}
+        # Two different cities within the cutoff is too uncertain to pick one
+        if len(candidates) != 1:
+            return None
+        return candidates.pop()
+
+    def _qualifies(self, location: Location, qualifier: str) -> bool:
+        # "New York, NY, USA" -> every comma-separated part must confirm the city
+        parts = [part.strip().strip(")").strip() for part in qualifier.split(",")]
+        if not all(parts):
+            return False
+        accepted = {
+            _normalize(name)
+            for name in (location.country, *_COUNTRY_ALIASES.get(location.country, ()), *location.region)
+        }
+        # Airport codes and names ("Paris (CDG)", "London (Heathrow)") resolve back to the city
+        return all(_normalize(part) in accepted or self._exact(part) == location for part in parts)
+
+    def resolve(self, text: str, cutoff: float = 0.85) -> Optional[Location]:
+        """
+        Resolve a free-text city, airport code or alias to its canonical location.
+
+        Args:
+            text (str): Place name as returned by the LLM (e.g. "NYC", "JFK", "New York City").
+            cutoff (float): Minimum similarity ratio for a fuzzy match.
+
+        Returns:
+            Optional[Location]: The canonical location, or None if nothing matches confidently.
+        """
+        if not isinstance(text, str):
+            return None
+        key = _normalize(text)
+        if not key:
+            return None
+
+        location = self._exact(text)
+        if location:
+            return location
+
+        # "Paris, France" / "Paris (CDG)" / "Chicago, IL" -> only accept the leading part when the
+        # qualifier confirms it, so "Paris, Texas" is not sent to France
+        parts = re.split(r"[,(/]", text, maxsplit=1)
+        if len(parts) == 2:
+            location = self._exact(parts[0]) or self._fuzzy(_normalize(parts[0]), cutoff)
+            qualifier = parts[1]
+            if location and self._qualifies(location, qualifier):
+                return location
+            return None
+
+        return self._fuzzy(key, cutoff)
+
+
+LOCATION_INDEX = LocationIndex()
@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("agno")
+
+from conversation import TripConversationAgent
+
+
+@pytest.fixture
+def agent():
+    # Skip Agent.__init__ so no model or API key is needed; only the trip state is used
+    agent = TripConversationAgent.__new__(TripConversationAgent)
+    agent.final_params = dict.fromkeys(
+        ["trip_type", "origin", "destination", "dates", "travelers", "accommodation", "budget", "requirements"]
+    )
+    agent.final_param_keys = list(agent.final_params.keys())
+    agent.location_keys = ("origin", "destination")
+    agent.suffix = ""
+    return agent
+
+
+def complete_params(**overrides):
+    params = {
+        "trip_type": "Holiday",
+        "origin": "London",
+        "destination": "Paris",
+        "dates": {"start_date": "2026-11-01", "end_date": "2026-11-05"},
+        "travelers": {"adults": 2, "children": 0},
+        "accommodation": "Hotel",
+        "budget": "USD 3000",
+        "requirements": "None",
+    }
+    params.update(overrides)
+    return params
+
+
+def test_origin_and_destination_are_canonicalized(agent):
+    result = agent._TripConversationAgent__process_tripdata(complete_params(origin="NYC", destination="Paris, France"))
+    assert agent.final_params["origin"] == "New York"
+    assert agent.final_params["destination"] == "Paris"
+    assert result["missing"] is False
+    assert result["local_message"] is False
+
+
+def test_unknown_location_is_kept_as_given(agent):
+    agent._TripConversationAgent__process_tripdata(complete_params(destination="Paris, Texas"))
+    assert agent.final_params["destination"] == "Paris, Texas"
+
+
+def test_same_city_trip_is_rejected_locally(agent):
+    result = agent._TripConversationAgent__process_tripdata(complete_params(origin="NYC", destination="New York City"))
+    assert agent.final_params["destination"] is None
+    assert result["missing"] is True
+    assert result["local_message"] is True
+    assert result["user_message"] == "Origin and destination are both New York — where are you travelling to?"
+
+
+def test_same_city_message_lists_other_missing_fields(agent):
+    result = agent._TripConversationAgent__process_tripdata(
+        {"origin": "NYC", "destination": "New York City", "trip_type": "Holiday"}
+    )
+    assert result["local_message"] is True
+    assert result["user_message"].startswith("Origin and destination are both New York")
+    assert "Also missing: dates, travelers, accommodation, budget, requirements." in result["user_message"]
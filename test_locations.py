@@ -0,0 +1,58 @@
+import pytest
+
+from locations import LOCATION_INDEX
+
+
+@pytest.mark.parametrize("text, code", [
+    ("London", "LON"),
+    ("paris", "PAR"),
+    ("New York City", "NYC"),
+    ("NYC", "NYC"),
+    ("Bombay", "BOM"),
+    ("JFK", "NYC"),
+    ("LHR", "LON"),
+    ("Zürich", "ZRH"),
+    ("Montréal", "YMQ"),
+    ("Paris, France", "PAR"),
+    ("Paris (CDG)", "PAR"),
+    ("London, UK", "LON"),
+    ("Londn", "LON"),
+    ("Barcelonna", "BCN"),
+    ("Lyon", "LYS"),
+    ("New York, NY", "NYC"),
+    ("New York, NY, USA", "NYC"),
+    ("San Francisco, CA", "SFO"),
+    ("Chicago, IL", "CHI"),
+    ("Los Angeles, California", "LAX"),
+    ("Washington, DC", "WAS"),
+    ("Toronto, ON", "YTO"),
+    ("Dallas", "DFW"),
+    ("Kyoto", "UKY"),
+    ("Seville", "SVQ"),
+    ("Heathrow", "LON"),
+    ("Newark", "NYC"),
+    ("London (Heathrow)", "LON"),
+])
+def test_resolve(text, code):
+    assert LOCATION_INDEX.resolve(text).code == code
+
+
+@pytest.mark.parametrize("text", [
+    "Bath",
+    "Bern",
+    "Mian",
+    "Sea",
+    "Man",
+    "Paris, Texas",
+    "London, Ontario",
+    "Sydney, Nova Scotia",
+    "Vancouver, WA",
+    "Portland, Maine",
+    "Chicago, IL, France",
+    "London (Newark)",
+    "Atlantis",
+    "",
+    None,
+])
+def test_resolve_rejects_unknown_or_uncertain(text):
+    assert LOCATION_INDEX.resolve(text) is None
@@ -2,6 +2,7 @@ from agno.agent import Agent, RunResponse
 from agno.utils.log import logger
 from agno.workflow import Workflow
 from instructions import Instructions
+from locations import LOCATION_INDEX
 from utils import getModel, getSearchTool
 import json
 
@@ -38,10 +39,19 @@ class ItenaryGeneratorWorkflow(Workflow):
             add_datetime_to_instructions=True
         )
     
+    def __describe_location(self, place):
+        location = LOCATION_INDEX.resolve(place)
+        if not location:
+            return place
+        # Canonical city code plus airport codes keep flight searches consistent across spellings
+        return f"{location.city}, {location.country} ({location.code}: {', '.join(location.airports)})"
+
     def __generate_trip_query(self, queryJSON):
         trip_type = queryJSON.get('trip_type', 'Holiday')
         origin = queryJSON.get('origin', 'unspecified')
         destination = queryJSON.get('destination', 'unspecified')
+        origin = self.__describe_location(origin)
+        destination = self.__describe_location(destination)
         start_date = queryJSON.get('dates', {}).get('start_date', 'unspecified')
         end_date = queryJSON.get('dates', {}).get('end_date', 'unspecified')
 